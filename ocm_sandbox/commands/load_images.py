@@ -5,30 +5,38 @@ This module handles the common multi-arch image loading issues with Kind by tryi
 multiple methods to ensure images are properly loaded into Kind clusters.
 """
 
+import functools
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Literal, Optional, Sequence, Tuple
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-try:
-    import yaml
+console = Console()
 
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
+# Default number of images loaded concurrently (each load is I/O-bound on docker/kind subprocesses)
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
 
-console = Console()
 
+def run_command(
+    cmd: List[str], check: bool = False, capture: Literal["none", "stderr", "both"] = "stderr"
+) -> subprocess.CompletedProcess:
+    """Run a shell command and return the result.
 
-def run_command(cmd: List[str], check: bool = False, capture_output: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+    Only the streams selected by `capture` are kept; the rest go to /dev/null so
+    progress output from docker/kind is never buffered in memory.
+    """
+    stdout = subprocess.PIPE if capture == "both" else subprocess.DEVNULL
+    stderr = subprocess.DEVNULL if capture == "none" else subprocess.PIPE
     try:
-        result = subprocess.run(cmd, capture_output=capture_output, text=True, check=check)
+        result = subprocess.run(cmd, stdout=stdout, stderr=stderr, text=True, check=check)
         return result
     except subprocess.CalledProcessError as e:
         if check:
@@ -36,14 +44,31 @@ def run_command(cmd: List[str], check: bool = False, capture_output: bool = True
         return e
 
 
+@functools.lru_cache(maxsize=None)
+def list_kind_clusters() -> Optional[Tuple[str, ...]]:
+    """List Kind clusters (cached, clusters are not created or deleted during a run)."""
+    result = run_command(["kind", "get", "clusters"], capture="both")
+    if result.returncode != 0:
+        return None
+    return tuple(result.stdout.strip().split("\n"))
+
+
+@functools.lru_cache(maxsize=None)
+def list_kind_nodes(cluster_name: str) -> Optional[Tuple[str, ...]]:
+    """List the node containers of a Kind cluster (cached per cluster)."""
+    result = run_command(["kind", "get", "nodes", "--name", cluster_name], capture="both")
+    if result.returncode != 0:
+        return None
+    return tuple(result.stdout.split())
+
+
 def check_kind_cluster(cluster_name: str) -> bool:
     """Check if Kind cluster exists."""
-    result = run_command(["kind", "get", "clusters"])
-    if result.returncode != 0:
+    clusters = list_kind_clusters()
+    if clusters is None:
         console.print("[red]Error: Failed to list Kind clusters[/red]")
         return False
 
-    clusters = result.stdout.strip().split("\n")
     if cluster_name in clusters:
         console.print(f"[green]✓[/green] Kind cluster '{cluster_name}' found")
         return True
@@ -66,39 +91,108 @@ def load_image_direct(image: str, cluster_name: str) -> bool:
     return False
 
 
-def load_image_archive(image: str, cluster_name: str) -> bool:
-    """Try docker save/load with archive (Method 2)."""
-    console.print("[blue]Method 2:[/blue] Creating platform-specific image archive")
-    safe_name = image.replace("/", "_").replace(":", "_")
-    temp_file = f"/tmp/kind-image-{safe_name}.tar"
+def can_stream_archive(cluster_name: str) -> bool:
+    """Check if an image archive can be piped into the cluster instead of written to disk."""
+    # kind opens the archive once per node, so a pipe can only be consumed by single-node clusters
+    if not os.path.exists("/dev/stdin"):
+        return False
+    nodes = list_kind_nodes(cluster_name)
+    return nodes is not None and len(nodes) == 1
+
+
+def stream_image_archive(images: List[str], cluster_name: str, save_args: Sequence[str] = ()) -> Optional[bool]:
+    """Pipe `docker save` straight into `kind load image-archive` without a temp file.
+
+    Returns None when kind could not read the archive from /dev/stdin, so the caller can retry with a file.
+    """
+    save = subprocess.Popen(["docker", "save", *save_args, *images], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    load = subprocess.Popen(
+        ["kind", "load", "image-archive", "/dev/stdin", "--name", cluster_name],
+        stdin=save.stdout,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    # Close our copy so docker save gets SIGPIPE if kind exits early
+    save.stdout.close()
+    _, load_stderr = load.communicate()
+    save.wait()
+    if save.returncode == 0 and load.returncode == 0:
+        return True
+    # kind names the archive path when it cannot open or stat it; any other failure would recur with a file
+    if load.returncode != 0 and "/dev/stdin" in load_stderr:
+        return None
+    return False
+
+
+def load_archive(images: List[str], cluster_name: str, temp_prefix: str, save_args: Sequence[str] = ()) -> bool:
+    """Save images into a single archive and load it into the cluster."""
+    if can_stream_archive(cluster_name):
+        streamed = stream_image_archive(images, cluster_name, save_args)
+        if streamed is not None:
+            return streamed
+        console.print(f"[yellow]kind could not read /dev/stdin for {cluster_name}, retrying with a temp file[/yellow]")
+
+    # Unique per call so concurrent loads never share a tarball; honours TMPDIR
+    fd, temp_file = tempfile.mkstemp(prefix=temp_prefix, suffix=".tar")
+    os.close(fd)
 
     try:
-        # Save image to tar
-        result = run_command(["docker", "save", image, "-o", temp_file])
+        # Save images to tar
+        result = run_command(["docker", "save", *save_args, *images, "-o", temp_file])
         if result.returncode != 0:
             return False
 
         # Load into kind
         result = run_command(["kind", "load", "image-archive", temp_file, "--name", cluster_name])
-        if result.returncode == 0:
-            console.print(f"[green]✓[/green] Loaded {image} via archive method")
-            return True
+        return result.returncode == 0
     finally:
         # Clean up temp file
         if os.path.exists(temp_file):
             os.remove(temp_file)
 
+
+def load_image_archive(image: str, cluster_name: str) -> bool:
+    """Try docker save/load with archive (Method 2)."""
+    console.print(f"[blue]Method 2:[/blue] Creating platform-specific image archive for {image}")
+    safe_name = image.replace("/", "_").replace(":", "_")
+
+    if load_archive([image], cluster_name, f"kind-image-{safe_name}-"):
+        console.print(f"[green]✓[/green] Loaded {image} via archive method")
+        return True
+    return False
+
+
+def load_images_batch(images: List[str], cluster_name: str) -> bool:
+    """Load several images with one `docker save` and one `kind load image-archive`."""
+    console.print(f"[blue]Batch:[/blue] Loading {len(images)} images into {cluster_name} as a single archive")
+
+    if load_archive(images, cluster_name, f"kind-batch-{cluster_name}-"):
+        console.print(f"[green]✓[/green] Loaded {len(images)} images into {cluster_name} in one batch")
+        return True
+    console.print(f"[yellow]Batch load into {cluster_name} failed, loading images individually...[/yellow]")
     return False
 
 
-def load_image_platform_pull(image: str, cluster_name: str, platform: str) -> bool:
+def looks_like_registry_image(image: str) -> bool:
+    """Check if an image reference names a registry or repository it could be pulled from."""
+    repository = image.split(":")[0]
+    return "." in repository or "/" in repository
+
+
+def load_image_platform_pull(
+    image: str, cluster_name: str, platform: str, registry_capable: Optional[bool] = None
+) -> bool:
     """Try pulling with specific platform and retry (Method 3)."""
+    if registry_capable is None:
+        registry_capable = looks_like_registry_image(image)
+
     # Only works for registry images
-    if "." not in image.split(":")[0] and "/" not in image.split(":")[0]:
-        console.print("[dim]Method 3: Skipped (local image, no registry to pull from)[/dim]")
+    if not registry_capable:
+        console.print(f"[dim]Method 3: Skipped for {image} (local image, no registry to pull from)[/dim]")
         return False
 
-    console.print(f"[blue]Method 3:[/blue] Pulling with specific platform ({platform})")
+    console.print(f"[blue]Method 3:[/blue] Pulling {image} with specific platform ({platform})")
     platform_image = f"{image}-kind-temp"
 
     try:
@@ -122,15 +216,42 @@ def load_image_platform_pull(image: str, cluster_name: str, platform: str) -> bo
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def docker_save_supports_platform() -> bool:
+    """Check if `docker save` accepts --platform (probed once per process)."""
+    result = run_command(["docker", "save", "--help"], capture="both")
+    return result.returncode == 0 and "--platform" in result.stdout
+
+
+def load_image_save_platform(image: str, cluster_name: str, platform: str) -> bool:
+    """Try saving only the target platform of the image (Method 4)."""
+    if not docker_save_supports_platform():
+        console.print(f"[dim]Method 4: Skipped for {image} (docker save does not support --platform)[/dim]")
+        return False
+
+    console.print(f"[blue]Method 4:[/blue] Saving {image} for platform {platform}")
+    safe_name = image.replace("/", "_").replace(":", "_")
+
+    if load_archive([image], cluster_name, f"kind-image-{safe_name}-", save_args=["--platform", platform]):
+        console.print(f"[green]✓[/green] Loaded {image} via platform-specific save")
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=1)
+def buildx_available() -> bool:
+    """Check if docker buildx is installed (probed once per process)."""
+    return run_command(["docker", "buildx", "version"]).returncode == 0
+
+
 def load_image_buildx(image: str, cluster_name: str, platform: str) -> bool:
-    """Try using buildx to create platform-specific image (Method 4)."""
-    # Check if buildx is available
-    result = run_command(["docker", "buildx", "version"])
-    if result.returncode != 0:
-        console.print("[dim]Method 4: Skipped (buildx not available)[/dim]")
+    """Try using buildx to create platform-specific image (Method 5)."""
+    if not buildx_available():
+        console.print(f"[dim]Method 5: Skipped for {image} (buildx not available)[/dim]")
         return False
 
-    console.print("[blue]Method 4:[/blue] Creating platform-specific image with buildx")
+    console.print(f"[blue]Method 5:[/blue] Creating platform-specific image for {image} with buildx")
+    buildx_image = f"{image}-kind"
 
     with tempfile.NamedTemporaryFile(mode="w", suffix=".Dockerfile", delete=False) as f:
         f.write(f"FROM {image}\n")
@@ -147,7 +268,7 @@ def load_image_buildx(image: str, cluster_name: str, platform: str) -> bool:
                 platform,
                 "--load",
                 "-t",
-                f"{image}-kind",
+                buildx_image,
                 "-f",
                 temp_dockerfile,
                 ".",
@@ -157,13 +278,13 @@ def load_image_buildx(image: str, cluster_name: str, platform: str) -> bool:
             return False
 
         # Load
-        result = run_command(["kind", "load", "docker-image", f"{image}-kind", "--name", cluster_name])
+        result = run_command(["kind", "load", "docker-image", buildx_image, "--name", cluster_name])
         if result.returncode == 0:
             console.print(f"[green]✓[/green] Loaded {image} via buildx method")
-            run_command(["docker", "rmi", f"{image}-kind"])
+            run_command(["docker", "rmi", buildx_image])
             return True
 
-        run_command(["docker", "rmi", f"{image}-kind"])
+        run_command(["docker", "rmi", buildx_image])
     finally:
         if os.path.exists(temp_dockerfile):
             os.remove(temp_dockerfile)
@@ -171,40 +292,108 @@ def load_image_buildx(image: str, cluster_name: str, platform: str) -> bool:
     return False
 
 
-def load_image_with_workaround(image: str, cluster_name: str, platform: str = "linux/amd64") -> bool:
-    """Load image with multi-arch workarounds."""
+def load_image_with_workaround(
+    image: str, cluster_name: str, platform: str = "linux/amd64", *, registry_capable: Optional[bool] = None
+) -> bool:
+    """Load image with multi-arch workarounds.
+
+    `registry_capable` lets callers pass a precomputed `looks_like_registry_image` result.
+    """
     console.print(f"\n[bold]Loading image:[/bold] {image}")
 
     # Method 1: Direct load
     if load_image_direct(image, cluster_name):
         return True
 
-    console.print("[yellow]Direct load failed, trying multi-arch workarounds...[/yellow]")
+    console.print(f"[yellow]Direct load of {image} failed, trying multi-arch workarounds...[/yellow]")
 
     # Method 2: Archive
     if load_image_archive(image, cluster_name):
         return True
 
     # Method 3: Platform pull
-    if load_image_platform_pull(image, cluster_name, platform):
+    if load_image_platform_pull(image, cluster_name, platform, registry_capable):
         return True
 
-    # Method 4: Buildx
+    # Method 4: Platform-specific save
+    if load_image_save_platform(image, cluster_name, platform):
+        return True
+
+    # Method 5: Buildx
     if load_image_buildx(image, cluster_name, platform):
         return True
 
     console.print(f"[red]Error: All methods failed for {image}[/red]")
-    console.print("\n[yellow]Suggestions:[/yellow]")
-    console.print(f"  1. Rebuild the image for platform {platform}")
-    console.print("  2. Use a multi-arch base image")
-    console.print(f"  3. Check if the image is available from a registry with {platform} support")
+    console.print(f"\n[yellow]Suggestions for {image}:[/yellow]")
+    console.print(f"  1. Rebuild {image} for platform {platform}")
+    console.print(f"  2. Use a multi-arch base image for {image}")
+    console.print(f"  3. Check if {image} is available from a registry with {platform} support")
 
     return False
 
 
-def load_images_from_config(config_path: Path, cluster_name: str, platform: str) -> int:
+def load_images_batched(targets: List[Tuple[str, str]]) -> Tuple[int, List[Tuple[str, str]]]:
+    """Batch-load images per cluster and return the loaded count and the targets still to load."""
+    images_by_cluster = defaultdict(list)
+    for image, cluster_name in targets:
+        images_by_cluster[cluster_name].append(image)
+
+    loaded_count = 0
+    remaining = []
+    for cluster_name, cluster_images in images_by_cluster.items():
+        # A single image goes straight to the per-image methods, which start with a direct load
+        if len(cluster_images) > 1 and load_images_batch(cluster_images, cluster_name):
+            loaded_count += len(cluster_images)
+        else:
+            remaining.extend((image, cluster_name) for image in cluster_images)
+
+    return loaded_count, remaining
+
+
+def load_images_parallel(
+    targets: List[Tuple[str, str]],
+    platform: str,
+    jobs: int = DEFAULT_JOBS,
+    on_done: Optional[Callable[[Future], None]] = None,
+) -> Tuple[int, int]:
+    """Load (image, cluster) pairs concurrently and return (loaded, failed) counts."""
+    loaded_count = 0
+    failed_count = 0
+    if not targets:
+        return loaded_count, failed_count
+
+    # Per-image preflight checks are done once up front, not inside each worker
+    registry_capable = {image: looks_like_registry_image(image) for image, _ in targets}
+    # Fallback methods use fixed temporary tags per image, so loads of one image must not overlap
+    image_locks = {image: threading.Lock() for image, _ in targets}
+
+    def load_target(image: str, cluster_name: str) -> bool:
+        with image_locks[image]:
+            return load_image_with_workaround(image, cluster_name, platform, registry_capable=registry_capable[image])
+
+    # Console.print is thread-safe, so workers can report progress directly
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(targets)))) as executor:
+        futures = []
+        for image, cluster_name in targets:
+            future = executor.submit(load_target, image, cluster_name)
+            if on_done:
+                future.add_done_callback(on_done)
+            futures.append(future)
+
+        for future in as_completed(futures):
+            if future.result():
+                loaded_count += 1
+            else:
+                failed_count += 1
+
+    return loaded_count, failed_count
+
+
+def load_images_from_config(config_path: Path, cluster_name: str, platform: str, jobs: int = DEFAULT_JOBS) -> int:
     """Load images from YAML configuration file."""
-    if not YAML_AVAILABLE:
+    try:
+        from ocm_sandbox.utils.yaml_utils import SafeLoader, load
+    except ImportError:
         console.print("[red]Error: PyYAML is not installed. Install with: pip install pyyaml[/red]")
         return 1
 
@@ -214,11 +403,18 @@ def load_images_from_config(config_path: Path, cluster_name: str, platform: str)
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = load(f, Loader=SafeLoader)
     except Exception as e:
         console.print(f"[red]Error: Failed to parse YAML configuration: {e}[/red]")
         return 1
 
+    return process_images_config(config, cluster_name, platform, jobs)
+
+
+def process_images_config(config: Any, cluster_name: str, platform: str, jobs: int = DEFAULT_JOBS) -> int:
+    """Load the images listed in an already parsed configuration."""
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
     if not config or "images" not in config:
         console.print("[red]Error: Configuration file must contain an 'images' list[/red]")
         return 1
@@ -228,43 +424,52 @@ def load_images_from_config(config_path: Path, cluster_name: str, platform: str)
         console.print("[red]Error: 'images' must be a list[/red]")
         return 1
 
-    loaded_count = 0
+    targets = []
     failed_count = 0
-
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task(f"Processing {len(images)} images...", total=len(images))
-
-        for item in images:
-            if isinstance(item, str):
-                # Simple format: just image name
-                image = item
-                target_cluster = cluster_name
-            elif isinstance(item, dict):
-                # Advanced format: {image: "name", cluster: "cluster-name"}
-                image = item.get("image")
-                target_cluster = item.get("cluster", cluster_name)
-                if not image:
-                    console.print(f"[yellow]Warning: Skipping invalid entry: {item}[/yellow]")
-                    continue
-            else:
+    cluster_found = {}
+    for item in images:
+        if isinstance(item, str):
+            # Simple format: just image name
+            image = item
+            target_cluster = cluster_name
+        elif isinstance(item, dict):
+            # Advanced format: {image: "name", cluster: "cluster-name"}
+            image = item.get("image")
+            target_cluster = item.get("cluster", cluster_name)
+            if not image:
                 console.print(f"[yellow]Warning: Skipping invalid entry: {item}[/yellow]")
                 continue
+        else:
+            console.print(f"[yellow]Warning: Skipping invalid entry: {item}[/yellow]")
+            continue
 
-            progress.update(task, description=f"Processing: {image} -> {target_cluster}")
-
-            # Check cluster exists
-            if not check_kind_cluster(target_cluster):
-                failed_count += 1
-                progress.advance(task)
-                continue
-
-            # Load image
-            if load_image_with_workaround(image, target_cluster, platform):
-                loaded_count += 1
-            else:
-                failed_count += 1
-
-            progress.advance(task)
+        # Check cluster exists (once per distinct cluster)
+        if target_cluster not in cluster_found:
+            cluster_found[target_cluster] = check_kind_cluster(target_cluster)
+        if not cluster_found[target_cluster]:
+            failed_count += 1
+            continue
+
+        targets.append((image, target_cluster))
+
+    # One transient bar redrawn only when an image finishes (no background refresh thread)
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        auto_refresh=False,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Loading images", total=len(targets))
+        loaded_count, remaining = load_images_batched(targets)
+        progress.update(task, advance=loaded_count, refresh=True)
+
+        loaded, load_failures = load_images_parallel(
+            remaining, platform, jobs, on_done=lambda _: progress.update(task, advance=1, refresh=True)
+        )
+        loaded_count += loaded
+        failed_count += load_failures
 
     console.print(f"\n[green]Successfully loaded {loaded_count} images[/green]")
     if failed_count > 0:
@@ -280,6 +485,7 @@ def load_images_command(
         os.environ.get("DOCKER_PLATFORM", "linux/amd64"), "--platform", "-p", help="Target platform"
     ),
     config: Optional[Path] = typer.Option(None, "--config", help="YAML configuration file with images to load"),
+    jobs: int = typer.Option(DEFAULT_JOBS, "--jobs", "-j", min=1, help="Number of images to load concurrently"),
 ) -> None:
     """
     Load Docker images into Kind clusters with multi-arch workarounds.
@@ -287,12 +493,18 @@ def load_images_command(
     This command handles multi-arch image loading issues by trying multiple
     methods to ensure images are properly loaded.
 
+    \b
+    Multiple images for the same cluster are first loaded together as a
+    single archive. If that fails, each image falls back to the methods
+    below.
+
     \b
     Methods tried (in order):
     1. Direct kind load
     2. Docker save/load with archive
     3. Platform-specific pull
-    4. Buildx with platform specification
+    4. Platform-specific docker save (when supported)
+    5. Buildx with platform specification
 
     \b
     Examples:
@@ -307,14 +519,17 @@ def load_images_command(
 
         # Use different platform
         ocm-sandbox load-images --platform linux/arm64 my-app:latest
+
+        # Load up to 4 images at a time
+        ocm-sandbox load-images --jobs 4 nginx:alpine redis:7 busybox:latest
     """
-    # Check prerequisites
-    if subprocess.run(["which", "kind"], capture_output=True).returncode != 0:
+    # Check prerequisites (in-process PATH lookups, no `which` subprocesses)
+    if shutil.which("kind") is None:
         console.print("[red]Error: kind command not found! Please install Kind first.[/red]")
         console.print("[yellow]Install: https://kind.sigs.k8s.io/docs/user/quick-start/#installation[/yellow]")
         raise typer.Exit(1)
 
-    if subprocess.run(["which", "docker"], capture_output=True).returncode != 0:
+    if shutil.which("docker") is None:
         console.print("[red]Error: docker command not found! Please install Docker first.[/red]")
         raise typer.Exit(1)
 
@@ -324,7 +539,7 @@ def load_images_command(
 
     # Load from config file
     if config:
-        result = load_images_from_config(config, cluster, platform)
+        result = load_images_from_config(config, cluster, platform, jobs)
         raise typer.Exit(result)
 
     # Load from command line arguments
@@ -335,14 +550,9 @@ def load_images_command(
     console.print(f"[blue]Loading {len(images)} image(s) into Kind cluster: {cluster}[/blue]")
     console.print(f"[blue]Target platform: {platform}[/blue]")
 
-    loaded_count = 0
-    failed_count = 0
-
-    for image in images:
-        if load_image_with_workaround(image, cluster, platform):
-            loaded_count += 1
-        else:
-            failed_count += 1
+    loaded_count, remaining = load_images_batched([(image, cluster) for image in images])
+    loaded, failed_count = load_images_parallel(remaining, platform, jobs)
+    loaded_count += loaded
 
     console.print(f"\n[green]Image loading completed! Loaded {loaded_count}/{len(images)} images[/green]")
 
@@ -10,7 +10,6 @@ Creates the necessary OCM resources to get started:
 from typing import Any, Dict, List
 
 import typer
-import yaml
 from rich.console import Console
 
 console = Console()
@@ -75,6 +74,8 @@ def scaffold_command(
     After generation, apply to hub:
         kubectl apply -f scaffolding.yaml --context kind-ocm-hub
     """
+    from ocm_sandbox.utils.yaml_utils import SafeDumper, dump_all
+
     console.print("[blue]Generating OCM scaffolding resources...[/blue]")
     console.print(f"  Name: {name}")
     console.print(f"  Namespace: {namespace}")
@@ -84,9 +85,7 @@ def scaffold_command(
     manifests = generate_scaffolding_manifests(name, namespace, clusterset, placement)
 
     with open(output, "w", encoding="utf-8") as f:
-        for manifest in manifests:
-            yaml.dump(manifest, f, default_flow_style=False)
-            f.write("---\n")
+        dump_all(manifests, f, Dumper=SafeDumper, default_flow_style=False, explicit_start=True)
 
     console.print(f"\n[green]Success! Generated {output}[/green]")
     console.print("\n[yellow]Next steps:[/yellow]")
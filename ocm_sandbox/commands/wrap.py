@@ -7,107 +7,137 @@ Converts Helm chart templates into OCM ManifestWorkReplicaSet resources with:
 - Automatic 256KB splitting for large manifests
 """
 
+import functools
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import typer
-import yaml
 from rich.console import Console
-from rich.table import Table
 
 console = Console()
 
 # Constants
 MAX_FILE_SIZE = 256 * 1024  # 256 KB size limit for MWRS
+MANIFESTS_PLACEHOLDER = "__ocm_sandbox_manifests__"  # Replaced by the pre-rendered workload manifests
+
+# Resource plurals that differ from simply appending "s" or are listed for clarity
+SPECIAL_PLURALS = {
+    "endpoints": "endpoints",
+    "ingress": "ingresses",
+    "networkpolicy": "networkpolicies",
+    "configmap": "configmaps",
+    "secret": "secrets",
+    "serviceaccount": "serviceaccounts",
+    "persistentvolumeclaim": "persistentvolumeclaims",
+    "rolebinding": "rolebindings",
+    "clusterrole": "clusterroles",
+    "clusterrolebinding": "clusterrolebindings",
+    "horizontalpodautoscaler": "horizontalpodautoscalers",
+    "poddisruptionbudget": "poddisruptionbudgets",
+    "statefulset": "statefulsets",
+    "daemonset": "daemonsets",
+    "deployment": "deployments",
+    "job": "jobs",
+    "cronjob": "cronjobs",
+    "service": "services",
+    "pod": "pods",
+}
+
+# Verbs granted to the Klusterlet work agent on every CRD API group
+STANDARD_VERBS = ("get", "list", "watch", "create", "update", "patch", "delete")
+
+
+def _json_path(name: str, path: str) -> Mapping[str, str]:
+    """Read-only JSONPaths entry for the shared feedback tables."""
+    return MappingProxyType({"name": name, "path": path})
+
+
+# Only add JSONPaths for fields NOT covered by WellKnownStatus
+BUILTIN_JSON_PATHS = MappingProxyType(
+    {
+        "deployment": (
+            _json_path("SpecReplicas", ".spec.replicas"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+        "statefulset": (
+            _json_path("SpecReplicas", ".spec.replicas"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+        "daemonset": (
+            _json_path("DesiredNumberScheduled", ".status.desiredNumberScheduled"),
+            _json_path("NumberAvailable", ".status.numberAvailable"),
+            _json_path("UpdatedNumberScheduled", ".status.updatedNumberScheduled"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+        "job": (
+            _json_path("Succeeded", ".status.succeeded"),
+            _json_path("Failed", ".status.failed"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+        "pod": (
+            _json_path("Phase", ".status.phase"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+        "ingress": (
+            _json_path("LBIPs", ".status.loadBalancer.ingress[*].ip"),
+            _json_path("LBHosts", ".status.loadBalancer.ingress[*].hostname"),
+            _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+        ),
+    }
+)
+
+# Kinds with WellKnownStatus feedback support
+BUILTIN_KINDS = frozenset(BUILTIN_JSON_PATHS)
+
+# For other kinds (CRDs/custom), use robust JSONPaths
+CUSTOM_JSON_PATHS = (
+    _json_path("ObservedGeneration", ".status.observedGeneration"),
+    _json_path("DeletionTimestamp", ".metadata.deletionTimestamp"),
+)
 
 
 def split_apiversion(api_version: str) -> Tuple[str, str]:
     """Split API version into group and version."""
-    if "/" in api_version:
-        group, version = api_version.split("/", 1)
-    else:
-        group, version = "", api_version
+    group, sep, version = api_version.partition("/")
+    if not sep:
+        return "", api_version
     return group, version
 
 
+@functools.lru_cache(maxsize=None)
 def kind_to_resource_plural(kind: str) -> str:
     """Convert Kind to resource plural name."""
     k = (kind or "").lower()
-    special = {
-        "endpoints": "endpoints",
-        "ingress": "ingresses",
-        "networkpolicy": "networkpolicies",
-        "configmap": "configmaps",
-        "secret": "secrets",
-        "serviceaccount": "serviceaccounts",
-        "persistentvolumeclaim": "persistentvolumeclaims",
-        "rolebinding": "rolebindings",
-        "clusterrole": "clusterroles",
-        "clusterrolebinding": "clusterrolebindings",
-        "horizontalpodautoscaler": "horizontalpodautoscalers",
-        "poddisruptionbudget": "poddisruptionbudgets",
-        "statefulset": "statefulsets",
-        "daemonset": "daemonsets",
-        "deployment": "deployments",
-        "job": "jobs",
-        "cronjob": "cronjobs",
-        "service": "services",
-        "pod": "pods",
-    }
-    return special.get(k, f"{k}s")
+    return SPECIAL_PLURALS.get(k, f"{k}s")
 
 
 def build_feedback_for_manifest(m: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Build feedback configuration for a manifest."""
     if not isinstance(m, dict):
         return None
-    api_version = m.get("apiVersion", "")
-    kind = m.get("kind", "")
-    meta = m.get("metadata", {}) or {}
-    name = meta.get("name")
-    namespace = meta.get("namespace")
+    # Manifests are almost always well formed, so index directly and treat a failed lookup as invalid
+    try:
+        kind = m["kind"]
+        meta = m["metadata"]
+        name = meta["name"]
+    except (KeyError, TypeError):
+        return None
     if not kind or not name:
         return None
-    group, _ = split_apiversion(api_version)
+    namespace = meta.get("namespace")
+    group, _ = split_apiversion(m.get("apiVersion", ""))
     resource = kind_to_resource_plural(kind)
 
     k_low = kind.lower()
-    builtins = {"deployment", "statefulset", "daemonset", "job", "pod", "ingress"}
-    if k_low in builtins:
+    if k_low in BUILTIN_KINDS:
         rules = [{"type": "WellKnownStatus"}]
-        # Only add JSONPaths for fields NOT covered by WellKnownStatus
-        json_paths = []
-        if k_low in ["deployment", "statefulset"]:
-            json_paths = [
-                {"name": "SpecReplicas", "path": ".spec.replicas"},
-                {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-            ]
-        elif k_low == "daemonset":
-            json_paths = [
-                {"name": "DesiredNumberScheduled", "path": ".status.desiredNumberScheduled"},
-                {"name": "NumberAvailable", "path": ".status.numberAvailable"},
-                {"name": "UpdatedNumberScheduled", "path": ".status.updatedNumberScheduled"},
-                {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-            ]
-        elif k_low == "job":
-            json_paths = [
-                {"name": "Succeeded", "path": ".status.succeeded"},
-                {"name": "Failed", "path": ".status.failed"},
-                {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-            ]
-        elif k_low == "pod":
-            json_paths = [
-                {"name": "Phase", "path": ".status.phase"},
-                {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-            ]
-        elif k_low == "ingress":
-            json_paths = [
-                {"name": "LBIPs", "path": ".status.loadBalancer.ingress[*].ip"},
-                {"name": "LBHosts", "path": ".status.loadBalancer.ingress[*].hostname"},
-                {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-            ]
-        if json_paths:
-            rules.append({"type": "JSONPaths", "jsonPaths": json_paths})
+        # Copy the shared read-only entries into plain dicts the dumper can emit without anchors
+        json_paths = [dict(path) for path in BUILTIN_JSON_PATHS[k_low]]
+        rules.append({"type": "JSONPaths", "jsonPaths": json_paths})
         return {
             "resourceIdentifier": {
                 "group": group,
@@ -118,11 +148,7 @@ def build_feedback_for_manifest(m: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             "feedbackRules": rules,
         }
 
-    # For other kinds (CRDs/custom), use robust JSONPaths
-    json_paths = [
-        {"name": "ObservedGeneration", "path": ".status.observedGeneration"},
-        {"name": "DeletionTimestamp", "path": ".metadata.deletionTimestamp"},
-    ]
+    json_paths = [dict(path) for path in CUSTOM_JSON_PATHS]
     return {
         "resourceIdentifier": {
             "group": group,
@@ -136,21 +162,14 @@ def build_feedback_for_manifest(m: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 
 def extract_crd_resources(helm_templates: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Extract CRD-related API groups and resources for RBAC generation."""
-    rbac_rules = {}
+    crds = (m for m in helm_templates if isinstance(m, dict) and m.get("kind") == "CustomResourceDefinition")
 
-    for manifest in helm_templates:
-        if isinstance(manifest, dict) and manifest.get("kind") == "CustomResourceDefinition":
-            api_group = manifest["spec"]["group"]
-            resources = [manifest["spec"]["names"]["plural"]]
-            verbs = ["get", "list", "watch", "create", "update", "patch", "delete"]
+    resources_by_group = {}
+    for crd in crds:
+        spec = crd["spec"]
+        resources_by_group.setdefault(spec["group"], set()).add(spec["names"]["plural"])
 
-            if api_group not in rbac_rules:
-                rbac_rules[api_group] = {"resources": set(), "verbs": set()}
-
-            rbac_rules[api_group]["resources"].update(resources)
-            rbac_rules[api_group]["verbs"].update(verbs)
-
-    return rbac_rules
+    return {group: {"resources": resources, "verbs": STANDARD_VERBS} for group, resources in resources_by_group.items()}
 
 
 def create_rbac_manifests(rbac_rules: Dict[str, Dict[str, Any]], role_name: str) -> List[Dict[str, Any]]:
@@ -165,10 +184,11 @@ def create_rbac_manifests(rbac_rules: Dict[str, Dict[str, Any]], role_name: str)
         "rules": [],
     }
 
+    # Sorted resources (and verbs given as a set) keep the generated RBAC stable between runs
     for api_group, data in rbac_rules.items():
-        cluster_role["rules"].append(
-            {"apiGroups": [api_group], "resources": list(data["resources"]), "verbs": list(data["verbs"])}
-        )
+        verbs = data["verbs"]
+        verbs = sorted(verbs) if isinstance(verbs, (set, frozenset)) else list(verbs)
+        cluster_role["rules"].append({"apiGroups": [api_group], "resources": sorted(data["resources"]), "verbs": verbs})
 
     cluster_role_binding = {
         "apiVersion": "rbac.authorization.k8s.io/v1",
@@ -187,24 +207,50 @@ def create_rbac_manifests(rbac_rules: Dict[str, Dict[str, Any]], role_name: str)
     return [cluster_role, cluster_role_binding]
 
 
+def utf8_size(text: str) -> int:
+    """Return the UTF-8 encoded size of text without encoding it when it is pure ASCII."""
+    # str.isascii() is O(1) in CPython, and ASCII text has one byte per character
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def splice_manifests(envelope_yaml: str, rendered_manifests: List[str]) -> str:
+    """Replace the manifests placeholder in a dumped MWRS with pre-rendered manifest items."""
+    head, _, tail = envelope_yaml.partition(f" {MANIFESTS_PLACEHOLDER}\n")
+    if not rendered_manifests:
+        return f"{head} []\n{tail}"
+    key_line = head.rsplit("\n", 1)[-1]
+    indent = " " * (len(key_line) - len(key_line.lstrip()))
+    # Empty lines stay empty so block scalar contents are unchanged
+    manifests = re.sub(r"^(?=.)", indent, "".join(rendered_manifests), flags=re.MULTILINE)
+    return f"{head}\n{manifests}{tail}"
+
+
 def split_manifest_workload(
     workload: List[Dict[str, Any]], max_size: int = MAX_FILE_SIZE
-) -> List[List[Dict[str, Any]]]:
-    """Split workloads into multiple MWRS files if necessary."""
+) -> List[List[Tuple[Dict[str, Any], str]]]:
+    """Split workloads into multiple MWRS files if necessary.
+
+    Each manifest is returned with its rendered YAML so it is only serialized once.
+    """
+    from ocm_sandbox.utils.yaml_utils import NoAliasDumper, dump
+
     split_workloads = []
     current_workload = []
     current_size = 0
 
     for manifest in workload:
-        manifest_yaml = yaml.dump(manifest, default_flow_style=False)
-        manifest_size = len(manifest_yaml.encode("utf-8"))
+        # Rendered as a sequence item (its form under workload.manifests), alias-free so items
+        # rendered separately never clash on anchor names in one document
+        manifest_yaml = dump([manifest], Dumper=NoAliasDumper, default_flow_style=False)
+        manifest_size = utf8_size(manifest_yaml)
 
-        if current_size + manifest_size > max_size:
+        # A manifest larger than max_size gets a part of its own rather than leaving an empty part before it
+        if current_workload and current_size + manifest_size > max_size:
             split_workloads.append(current_workload)
             current_workload = []
             current_size = 0
 
-        current_workload.append(manifest)
+        current_workload.append((manifest, manifest_yaml))
         current_size += manifest_size
 
     if current_workload:
@@ -213,6 +259,16 @@ def split_manifest_workload(
     return split_workloads
 
 
+def write_mwrs_file(filename: str, mwrs_content: Dict[str, Any], rendered_manifests: List[str]) -> str:
+    """Write one MWRS file, splicing the pre-rendered manifests into its envelope."""
+    from ocm_sandbox.utils.yaml_utils import SafeDumper, dump
+
+    envelope_yaml = dump(mwrs_content, Dumper=SafeDumper, default_flow_style=False)
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(splice_manifests(envelope_yaml, rendered_manifests))
+    return filename
+
+
 def generate_mwrs_files(
     helm_templates: List[Dict[str, Any]],
     name: str,
@@ -229,34 +285,38 @@ def generate_mwrs_files(
         helm_templates.extend(rbac_manifests)
 
     split_workloads = split_manifest_workload(helm_templates)
-    output_files = []
-
-    for index, workload in enumerate(split_workloads):
-        # Build feedback for the manifests in this split
-        manifest_configs = []
-        for m in workload:
-            cfg = build_feedback_for_manifest(m)
-            if cfg:
-                manifest_configs.append(cfg)
-        filename = f"{output_prefix}_part_{index+1}.yaml"
-        mwrs_content = {
-            "apiVersion": "work.open-cluster-management.io/v1alpha1",
-            "kind": "ManifestWorkReplicaSet",
-            "metadata": {
-                "name": f"{name}-{index+1}",
-                "namespace": namespace,
-            },
-            "spec": {
-                "cascadeDeletionPolicy": "Background",
-                "placementRefs": [{"name": placement}],
-                "manifestWorkTemplate": {"manifestConfigs": manifest_configs, "workload": {"manifests": workload}},
-            },
-        }
-        with open(filename, "w", encoding="utf-8") as f:
-            yaml.dump(mwrs_content, f, default_flow_style=False)
-        output_files.append(filename)
 
-    return output_files
+    # Each part is written by its own worker; results keep the part order
+    with ThreadPoolExecutor(max_workers=max(1, min(len(split_workloads), os.cpu_count() or 1))) as executor:
+        futures = []
+        for index, workload in enumerate(split_workloads):
+            # Build feedback for the manifests in this split
+            manifest_configs = []
+            for m, _ in workload:
+                cfg = build_feedback_for_manifest(m)
+                if cfg:
+                    manifest_configs.append(cfg)
+            filename = f"{output_prefix}_part_{index+1}.yaml"
+            mwrs_content = {
+                "apiVersion": "work.open-cluster-management.io/v1alpha1",
+                "kind": "ManifestWorkReplicaSet",
+                "metadata": {
+                    "name": f"{name}-{index+1}",
+                    "namespace": namespace,
+                },
+                "spec": {
+                    "cascadeDeletionPolicy": "Background",
+                    "placementRefs": [{"name": placement}],
+                    "manifestWorkTemplate": {
+                        "manifestConfigs": manifest_configs,
+                        "workload": {"manifests": MANIFESTS_PLACEHOLDER},
+                    },
+                },
+            }
+            rendered_manifests = [manifest_yaml for _, manifest_yaml in workload]
+            futures.append(executor.submit(write_mwrs_file, filename, mwrs_content, rendered_manifests))
+
+        return [future.result() for future in futures]
 
 
 def wrap_command(
@@ -283,14 +343,18 @@ def wrap_command(
         helm template my-app ./my-chart > rendered.yaml
         ocm-sandbox wrap -i rendered.yaml -n my-app -N default -p my-placement
     """
+    from rich.table import Table
+
+    from ocm_sandbox.utils.yaml_utils import SafeLoader, load_all
+
     if not input_file.exists():
         console.print(f"[red]Error: Input file not found: {input_file}[/red]")
         raise typer.Exit(1)
 
     console.print(f"[blue]Reading Helm templates from:[/blue] {input_file}")
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        helm_templates = [doc for doc in yaml.safe_load_all(f) if doc is not None]
+    # Parse a single in-memory buffer rather than streaming small reads through the parser
+    helm_templates = [doc for doc in load_all(input_file.read_bytes(), Loader=SafeLoader) if doc is not None]
 
     console.print(f"[blue]Found {len(helm_templates)} manifests[/blue]")
 
@@ -0,0 +1,28 @@
+"""
+YAML helpers shared by the OCM Sandbox commands.
+
+Prefers the libyaml C loader/dumper, which parse and emit large rendered
+Helm charts many times faster, and falls back to the pure-Python classes
+when PyYAML was built without libyaml.
+
+The commands import this module (and rich.progress / rich.table) inside the
+functions that use them, so `ocm-sandbox --help` does not pay for loading yaml.
+"""
+
+# Rebound here so callers import the functions directly instead of looking them up on `yaml` per call
+from yaml import dump, dump_all, load, load_all
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["NoAliasDumper", "SafeDumper", "SafeLoader", "dump", "dump_all", "load", "load_all"]
+
+
+class NoAliasDumper(SafeDumper):
+    """Dumper that never emits anchors, so separately dumped documents can be combined."""
+
+    def ignore_aliases(self, data):
+        return True
@@ -0,0 +1,14 @@
+"""
+Shared pytest configuration.
+
+Imports the CLI and command modules, plus the dependencies the commands load
+lazily, while tests are collected so the first test does not pay for them.
+"""
+import rich.progress  # noqa: F401
+import rich.table  # noqa: F401
+
+import ocm_sandbox.cli  # noqa: F401
+import ocm_sandbox.commands.load_images  # noqa: F401
+import ocm_sandbox.commands.scaffold  # noqa: F401
+import ocm_sandbox.commands.wrap  # noqa: F401
+import ocm_sandbox.utils.yaml_utils  # noqa: F401
@@ -0,0 +1 @@
+# Python-literal test fixtures shared across test modules
@@ -0,0 +1,19 @@
+"""
+Parsed load-images configurations shared by the load-images tests.
+"""
+
+# Simple format: image names loaded into the default cluster
+SIMPLE_CONFIG = {"images": ["nginx:alpine", "redis:7"]}
+
+# Advanced format: every image names its cluster
+ADVANCED_CONFIG = {
+    "images": [{"image": "nginx:alpine", "cluster": "cluster1"}, {"image": "redis:7", "cluster": "cluster2"}]
+}
+
+# Both formats in one list
+MIXED_CONFIG = {
+    "images": [
+        "nginx:alpine",
+        {"image": "redis:7", "cluster": "custom-cluster"},
+    ]
+}
@@ -0,0 +1,60 @@
+"""
+Expected scaffolding documents for the scaffold command tests.
+"""
+
+# ManagedClusterSetBinding, Placement and the namespace ManifestWorkReplicaSet generated for each argument set
+BASIC_DOCS = [
+    {
+        "apiVersion": "cluster.open-cluster-management.io/v1beta2",
+        "kind": "ManagedClusterSetBinding",
+        "metadata": {"name": "default", "namespace": "test-namespace"},
+        "spec": {"clusterSet": "default"},
+    },
+    {
+        "apiVersion": "cluster.open-cluster-management.io/v1beta1",
+        "kind": "Placement",
+        "metadata": {"name": "test-placement", "namespace": "test-namespace"},
+        "spec": {"clusterSets": ["default"]},
+    },
+    {
+        "apiVersion": "work.open-cluster-management.io/v1alpha1",
+        "kind": "ManifestWorkReplicaSet",
+        "metadata": {"name": "test-namespace-namespace-mwrs", "namespace": "test-namespace"},
+        "spec": {
+            "placementRefs": [{"name": "test-placement"}],
+            "manifestWorkTemplate": {
+                "workload": {
+                    "manifests": [{"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "test-namespace"}}]
+                }
+            },
+        },
+    },
+]
+
+CUSTOM_DOCS = [
+    {
+        "apiVersion": "cluster.open-cluster-management.io/v1beta2",
+        "kind": "ManagedClusterSetBinding",
+        "metadata": {"name": "custom-binding", "namespace": "custom-namespace"},
+        "spec": {"clusterSet": "custom-set"},
+    },
+    {
+        "apiVersion": "cluster.open-cluster-management.io/v1beta1",
+        "kind": "Placement",
+        "metadata": {"name": "custom-placement", "namespace": "custom-namespace"},
+        "spec": {"clusterSets": ["custom-set"]},
+    },
+    {
+        "apiVersion": "work.open-cluster-management.io/v1alpha1",
+        "kind": "ManifestWorkReplicaSet",
+        "metadata": {"name": "custom-namespace-namespace-mwrs", "namespace": "custom-namespace"},
+        "spec": {
+            "placementRefs": [{"name": "custom-placement"}],
+            "manifestWorkTemplate": {
+                "workload": {
+                    "manifests": [{"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "custom-namespace"}}]
+                }
+            },
+        },
+    },
+]
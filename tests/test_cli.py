@@ -3,12 +3,17 @@ Unit tests for the OCM Sandbox CLI entry points.
 
 Tests the Typer CLI commands and argument parsing.
 """
+from unittest.mock import patch
+
 import pytest
-from typer.testing import CliRunner
+from click.testing import CliRunner
+from typer.main import get_command
 
 from ocm_sandbox.cli import app
 
 runner = CliRunner()
+# Convert the Typer app to its Click command once instead of on every invoke
+cli = get_command(app)
 
 
 class TestCLIBasics:
@@ -16,7 +21,7 @@ class TestCLIBasics:
 
     def test_cli_no_args(self):
         """Test CLI with no arguments shows help."""
-        result = runner.invoke(app, [])
+        result = runner.invoke(cli, [])
         # Should show help or error with no args
         assert result.exit_code != 0 or "Usage" in result.stdout
 
@@ -26,7 +31,7 @@ class TestWrapCommand:
 
     def test_wrap_missing_required_args(self):
         """Test wrap fails without required arguments."""
-        result = runner.invoke(app, ["wrap"])
+        result = runner.invoke(cli, ["wrap"])
         assert result.exit_code != 0
 
     # Integration test disabled due to Typer configuration issues
@@ -35,7 +40,7 @@ class TestWrapCommand:
     def test_wrap_nonexistent_input(self):
         """Test wrap fails with nonexistent input file."""
         result = runner.invoke(
-            app,
+            cli,
             [
                 "wrap",
                 "--input",
@@ -64,10 +69,26 @@ class TestLoadImagesCommand:
 
     def test_load_images_requires_args(self):
         """Test load-images requires either images or config."""
-        result = runner.invoke(app, ["load-images"])
+        result = runner.invoke(cli, ["load-images"])
         # Will fail because no images specified and docker/kind not available
         assert result.exit_code != 0
 
+    def test_load_images_missing_kind(self):
+        """Test load-images reports a missing kind binary."""
+        with patch("ocm_sandbox.commands.load_images.shutil.which", return_value=None):
+            result = runner.invoke(cli, ["load-images", "nginx:alpine"])
+
+        assert result.exit_code == 1
+        assert "kind command not found" in result.stdout
+
+    def test_load_images_missing_docker(self):
+        """Test load-images reports a missing docker binary."""
+        with patch("ocm_sandbox.commands.load_images.shutil.which", side_effect={"kind": "/usr/bin/kind"}.get):
+            result = runner.invoke(cli, ["load-images", "nginx:alpine"])
+
+        assert result.exit_code == 1
+        assert "docker command not found" in result.stdout
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
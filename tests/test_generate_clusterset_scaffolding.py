@@ -2,77 +2,44 @@
 Unit tests for scaffold command (generate-clusterset-scaffolding logic).
 """
 import pytest
+import yaml
 
-from ocm_sandbox.commands.scaffold import generate_scaffolding_manifests
+from ocm_sandbox.commands.scaffold import generate_scaffolding_manifests, scaffold_command
+from ocm_sandbox.utils.yaml_utils import SafeLoader
 
+from .fixtures.scaffolding_expected import BASIC_DOCS, CUSTOM_DOCS
 
-class TestGenerateYaml:
-    """Test YAML generation for ClusterSet scaffolding."""
 
-    def test_generate_basic_scaffolding(self):
-        """Test generating basic scaffolding with default values."""
-        docs = generate_scaffolding_manifests(
-            name="default", namespace="test-namespace", clusterset="default", placement="test-placement"
-        )
+@pytest.fixture(scope="module")
+def basic_docs():
+    """Scaffolding generated with the default binding and clusterset."""
+    return generate_scaffolding_manifests(
+        name="default", namespace="test-namespace", clusterset="default", placement="test-placement"
+    )
 
-        # Should generate 3 documents: ManagedClusterSetBinding, Placement, ManifestWorkReplicaSet
-        assert len(docs) == 3
-
-        # Check ManagedClusterSetBinding
-        binding = docs[0]
-        assert binding["apiVersion"] == "cluster.open-cluster-management.io/v1beta2"
-        assert binding["kind"] == "ManagedClusterSetBinding"
-        assert binding["metadata"]["name"] == "default"
-        assert binding["metadata"]["namespace"] == "test-namespace"
-        assert binding["spec"]["clusterSet"] == "default"
-
-        # Check Placement
-        placement_doc = docs[1]
-        assert placement_doc["apiVersion"] == "cluster.open-cluster-management.io/v1beta1"
-        assert placement_doc["kind"] == "Placement"
-        assert placement_doc["metadata"]["name"] == "test-placement"
-        assert placement_doc["metadata"]["namespace"] == "test-namespace"
-        assert placement_doc["spec"]["clusterSets"] == ["default"]
-
-        # Check ManifestWorkReplicaSet
-        mwrs = docs[2]
-        assert mwrs["apiVersion"] == "work.open-cluster-management.io/v1alpha1"
-        assert mwrs["kind"] == "ManifestWorkReplicaSet"
-        assert mwrs["metadata"]["name"] == "test-namespace-namespace-mwrs"
-        assert mwrs["metadata"]["namespace"] == "test-namespace"
-        assert mwrs["spec"]["placementRefs"][0]["name"] == "test-placement"
-
-        # Check namespace manifest
-        namespace_manifest = mwrs["spec"]["manifestWorkTemplate"]["workload"]["manifests"][0]
-        assert namespace_manifest["apiVersion"] == "v1"
-        assert namespace_manifest["kind"] == "Namespace"
-        assert namespace_manifest["metadata"]["name"] == "test-namespace"
-
-    def test_generate_custom_values(self):
-        """Test generating scaffolding with custom values."""
-        docs = generate_scaffolding_manifests(
-            name="custom-binding", namespace="custom-namespace", clusterset="custom-set", placement="custom-placement"
-        )
 
-        assert len(docs) == 3
+@pytest.fixture(scope="module")
+def custom_docs():
+    """Scaffolding generated with custom values for every argument."""
+    return generate_scaffolding_manifests(
+        name="custom-binding", namespace="custom-namespace", clusterset="custom-set", placement="custom-placement"
+    )
 
-        # Verify custom values are used
-        binding = docs[0]
-        assert binding["metadata"]["name"] == "custom-binding"
-        assert binding["metadata"]["namespace"] == "custom-namespace"
-        assert binding["spec"]["clusterSet"] == "custom-set"
 
-        placement_doc = docs[1]
-        assert placement_doc["metadata"]["name"] == "custom-placement"
-        assert placement_doc["spec"]["clusterSets"] == ["custom-set"]
+class TestGenerateYaml:
+    """Test YAML generation for ClusterSet scaffolding."""
 
-        mwrs = docs[2]
-        assert mwrs["metadata"]["namespace"] == "custom-namespace"
-        assert mwrs["spec"]["placementRefs"][0]["name"] == "custom-placement"
+    def test_generate_basic_scaffolding(self, basic_docs):
+        """Test generating basic scaffolding with default values."""
+        assert basic_docs == BASIC_DOCS
 
-    def test_manifest_structure(self):
+    def test_generate_custom_values(self, custom_docs):
+        """Test generating scaffolding with custom values."""
+        assert custom_docs == CUSTOM_DOCS
+
+    def test_manifest_structure(self, basic_docs, custom_docs):
         """Test that manifests have correct structure."""
-        docs = generate_scaffolding_manifests(name="test", namespace="test", clusterset="test", placement="test")
+        docs = basic_docs + custom_docs
 
         # All documents should be dictionaries
         assert all(isinstance(doc, dict) for doc in docs)
@@ -84,5 +51,22 @@ class TestGenerateYaml:
             assert "metadata" in doc
 
 
+class TestScaffoldOutput:
+    """Test the scaffolding file written by the scaffold command."""
+
+    def test_write_scaffolding(self, tmp_path, basic_docs):
+        """Test each manifest is written as its own YAML document."""
+        output = tmp_path / "scaffolding.yaml"
+
+        scaffold_command(
+            name="default", namespace="test-namespace", clusterset="default", placement="test-placement", output=output
+        )
+
+        content = output.read_text(encoding="utf-8")
+        assert content.startswith("---\n")
+        assert content.count("---\n") == 3
+        assert list(yaml.load_all(content, Loader=SafeLoader)) == basic_docs
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,70 +1,85 @@
 """
 Unit tests for wrap command (helm_to_mwrs logic).
 """
+from unittest.mock import patch
+
 import pytest
 import yaml
 
 from ocm_sandbox.commands.wrap import (
+    MANIFESTS_PLACEHOLDER,
+    STANDARD_VERBS,
     build_feedback_for_manifest,
     create_rbac_manifests,
     extract_crd_resources,
+    generate_mwrs_files,
     kind_to_resource_plural,
+    splice_manifests,
     split_apiversion,
     split_manifest_workload,
+    utf8_size,
+    wrap_command,
 )
+from ocm_sandbox.utils import yaml_utils
+from ocm_sandbox.utils.yaml_utils import SafeLoader
 
 
 class TestSplitApiversion:
     """Test API version parsing."""
 
-    def test_with_group(self):
-        """Test parsing apiVersion with group."""
-        group, version = split_apiversion("apps/v1")
-        assert group == "apps"
-        assert version == "v1"
-
-    def test_without_group(self):
-        """Test parsing apiVersion without group (core)."""
-        group, version = split_apiversion("v1")
-        assert group == ""
-        assert version == "v1"
+    @pytest.mark.parametrize(
+        "api_version,expected",
+        [
+            ("apps/v1", ("apps", "v1")),  # with group
+            ("v1", ("", "v1")),  # core group
+        ],
+    )
+    def test_split_apiversion(self, api_version, expected):
+        """Test splitting apiVersion into group and version."""
+        assert split_apiversion(api_version) == expected
 
 
 class TestKindToResourcePlural:
     """Test kind to plural resource name conversion."""
 
-    def test_deployment(self):
-        """Test Deployment → deployments."""
-        assert kind_to_resource_plural("Deployment") == "deployments"
-
-    def test_service(self):
-        """Test Service → services."""
-        assert kind_to_resource_plural("Service") == "services"
-
-    def test_configmap(self):
-        """Test ConfigMap → configmaps."""
-        assert kind_to_resource_plural("ConfigMap") == "configmaps"
-
-    def test_ingress(self):
-        """Test Ingress → ingresses."""
-        assert kind_to_resource_plural("Ingress") == "ingresses"
-
-    def test_custom_resource(self):
-        """Test custom resource (generic pluralization)."""
-        assert kind_to_resource_plural("MyCustomResource") == "mycustomresources"
+    @pytest.mark.parametrize(
+        "kind,expected",
+        [
+            ("Deployment", "deployments"),
+            ("Service", "services"),
+            ("ConfigMap", "configmaps"),
+            ("Ingress", "ingresses"),
+            ("MyCustomResource", "mycustomresources"),  # generic pluralization
+        ],
+    )
+    def test_kind_to_resource_plural(self, kind, expected):
+        """Test Kind → plural resource name."""
+        assert kind_to_resource_plural(kind) == expected
+
+
+@pytest.fixture(scope="module")
+def feedback_by_kind():
+    """Feedback for one sample manifest per (kind, apiVersion), built once for the module."""
+    samples = [
+        ("Deployment", "apps/v1", "test-app"),
+        ("StatefulSet", "apps/v1", "test-sts"),
+        ("Service", "v1", "test-svc"),
+        ("CustomResource", "example.com/v1", "test-cr"),
+    ]
+    return {
+        (kind, api_version): build_feedback_for_manifest(
+            {"apiVersion": api_version, "kind": kind, "metadata": {"name": name, "namespace": "default"}}
+        )
+        for kind, api_version, name in samples
+    }
 
 
 class TestBuildFeedbackForManifest:
     """Test feedback rule generation for manifests."""
 
-    def test_deployment_feedback(self):
+    def test_deployment_feedback(self, feedback_by_kind):
         """Test feedback rules for Deployment."""
-        manifest = {
-            "apiVersion": "apps/v1",
-            "kind": "Deployment",
-            "metadata": {"name": "test-app", "namespace": "default"},
-        }
-        feedback = build_feedback_for_manifest(manifest)
+        feedback = feedback_by_kind[("Deployment", "apps/v1")]
 
         assert feedback is not None
         assert feedback["resourceIdentifier"]["group"] == "apps"
@@ -82,23 +97,26 @@ class TestBuildFeedbackForManifest:
         assert "SpecReplicas" in path_names
         assert "DeletionTimestamp" in path_names
 
-    def test_statefulset_feedback(self):
+    def test_statefulset_feedback(self, feedback_by_kind):
         """Test feedback rules for StatefulSet."""
-        manifest = {
-            "apiVersion": "apps/v1",
-            "kind": "StatefulSet",
-            "metadata": {"name": "test-sts", "namespace": "default"},
-        }
-        feedback = build_feedback_for_manifest(manifest)
+        feedback = feedback_by_kind[("StatefulSet", "apps/v1")]
 
         assert feedback is not None
         rule_types = [rule["type"] for rule in feedback["feedbackRules"]]
         assert "WellKnownStatus" in rule_types
 
-    def test_service_feedback(self):
+    def test_feedback_rules_not_shared(self):
+        """Test each manifest gets its own copy of the JSONPaths rules."""
+        manifest = {"apiVersion": "apps/v1", "kind": "Deployment", "metadata": {"name": "test-app"}}
+        first = build_feedback_for_manifest(manifest)["feedbackRules"][1]["jsonPaths"]
+        second = build_feedback_for_manifest(manifest)["feedbackRules"][1]["jsonPaths"]
+
+        assert first == second
+        assert all(a is not b for a, b in zip(first, second))
+
+    def test_service_feedback(self, feedback_by_kind):
         """Test feedback rules for Service (no built-in feedback)."""
-        manifest = {"apiVersion": "v1", "kind": "Service", "metadata": {"name": "test-svc", "namespace": "default"}}
-        feedback = build_feedback_for_manifest(manifest)
+        feedback = feedback_by_kind[("Service", "v1")]
 
         # Service is not in builtins, should get custom JSONPaths
         assert feedback is not None
@@ -106,14 +124,9 @@ class TestBuildFeedbackForManifest:
         assert "WellKnownStatus" not in rule_types
         assert "JSONPaths" in rule_types
 
-    def test_crd_feedback(self):
+    def test_crd_feedback(self, feedback_by_kind):
         """Test feedback rules for custom resources."""
-        manifest = {
-            "apiVersion": "example.com/v1",
-            "kind": "CustomResource",
-            "metadata": {"name": "test-cr", "namespace": "default"},
-        }
-        feedback = build_feedback_for_manifest(manifest)
+        feedback = feedback_by_kind[("CustomResource", "example.com/v1")]
 
         assert feedback is not None
         assert feedback["resourceIdentifier"]["group"] == "example.com"
@@ -142,6 +155,17 @@ class TestBuildFeedbackForManifest:
         feedback = build_feedback_for_manifest("not a dict")
         assert feedback is None
 
+        # Missing or null metadata
+        assert build_feedback_for_manifest({"apiVersion": "v1", "kind": "Pod"}) is None
+        assert build_feedback_for_manifest({"apiVersion": "v1", "kind": "Pod", "metadata": None}) is None
+
+    def test_namespace_optional(self):
+        """Test cluster-scoped manifests get no namespace."""
+        manifest = {"apiVersion": "rbac.authorization.k8s.io/v1", "kind": "ClusterRole", "metadata": {"name": "r"}}
+        feedback = build_feedback_for_manifest(manifest)
+
+        assert feedback["resourceIdentifier"]["namespace"] is None
+
 
 class TestExtractCrdResources:
     """Test CRD extraction and RBAC generation."""
@@ -189,6 +213,11 @@ class TestExtractCrdResources:
         assert "widgets" in rbac_rules["example.com"]["resources"]
         assert "gadgets" in rbac_rules["example.com"]["resources"]
         assert "things" in rbac_rules["other.io"]["resources"]
+        assert rbac_rules["example.com"]["resources"] == {"gadgets", "widgets"}
+
+        # Every group shares the one module-level verb tuple
+        assert rbac_rules["example.com"]["verbs"] is STANDARD_VERBS
+        assert rbac_rules["other.io"]["verbs"] is STANDARD_VERBS
 
     def test_no_crds(self):
         """Test with no CRDs."""
@@ -215,7 +244,8 @@ class TestCreateRbacManifests:
         assert cluster_role["metadata"]["name"] == "test-role"
         assert len(cluster_role["rules"]) == 1
         assert cluster_role["rules"][0]["apiGroups"] == ["example.com"]
-        assert set(cluster_role["rules"][0]["resources"]) == {"widgets", "gadgets"}
+        assert cluster_role["rules"][0]["resources"] == ["gadgets", "widgets"]
+        assert cluster_role["rules"][0]["verbs"] == ["create", "get", "list"]
 
         # Check ClusterRoleBinding
         cluster_role_binding = manifests[1]
@@ -224,6 +254,27 @@ class TestCreateRbacManifests:
         assert cluster_role_binding["roleRef"]["name"] == "test-role"
         assert cluster_role_binding["subjects"][0]["name"] == "klusterlet-work-sa"
 
+    def test_rbac_from_extracted_crds(self):
+        """Test RBAC generated from extracted CRDs is deterministic."""
+        manifests = [
+            {
+                "apiVersion": "apiextensions.k8s.io/v1",
+                "kind": "CustomResourceDefinition",
+                "spec": {"group": "example.com", "names": {"plural": plural}},
+            }
+            for plural in ["widgets", "gadgets", "things"]
+        ]
+
+        cluster_role = create_rbac_manifests(extract_crd_resources(manifests), "test-role")[0]
+
+        assert cluster_role["rules"] == [
+            {
+                "apiGroups": ["example.com"],
+                "resources": ["gadgets", "things", "widgets"],
+                "verbs": ["get", "list", "watch", "create", "update", "patch", "delete"],
+            }
+        ]
+
     def test_empty_rbac_rules(self):
         """Test with empty RBAC rules."""
         manifests = create_rbac_manifests({}, "test-role")
@@ -245,6 +296,11 @@ class TestSplitManifestWorkload:
         assert len(result) == 1
         assert len(result[0]) == 2
 
+        # Each manifest is returned with its rendered YAML
+        manifest, manifest_yaml = result[0][0]
+        assert manifest is manifests[0]
+        assert yaml.load(manifest_yaml, Loader=SafeLoader) == [manifests[0]]
+
     def test_split_required(self):
         """Test splitting when workload exceeds max size."""
         # Create large manifests
@@ -260,20 +316,135 @@ class TestSplitManifestWorkload:
         # Should split into multiple workloads
         assert len(result) > 1
 
-        # Each workload should be smaller than max_size
+        # Each workload's rendered YAML should be smaller than max_size
         for workload in result:
-            workload_yaml = "\n---\n".join(yaml.dump(m) for m in workload)
-            assert len(workload_yaml.encode("utf-8")) <= 200 * 1024
+            assert sum(len(manifest_yaml.encode("utf-8")) for _, manifest_yaml in workload) <= 200 * 1024
+
+    def test_oversized_first_manifest(self):
+        """Test a manifest larger than max_size does not leave an empty part before it."""
+        manifests = [
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "big"}, "data": {"large": "x" * 4096}},
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "small"}},
+        ]
+
+        result = split_manifest_workload(manifests, max_size=1024)
+
+        assert [[m["metadata"]["name"] for m, _ in workload] for workload in result] == [["big"], ["small"]]
+
+    def test_each_manifest_rendered_once(self):
+        """Test sizing renders every manifest exactly once, however many splits there are."""
+        large_data = "x" * (100 * 1024)
+        manifests = [
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": f"cm{i}"}, "data": {"large": large_data}}
+            for i in range(5)
+        ]
+
+        with patch("ocm_sandbox.utils.yaml_utils.dump", wraps=yaml_utils.dump) as mock_dump:
+            result = split_manifest_workload(manifests, max_size=200 * 1024)
+
+        assert mock_dump.call_count == len(manifests)
+        assert [m for workload in result for m, _ in workload] == manifests
+
+
+class TestSpliceManifests:
+    """Test splicing rendered manifests into an MWRS envelope."""
+
+    def test_empty_manifests(self):
+        """Test an empty workload is written as an empty list, not null."""
+        envelope = f"workload:\n  manifests: {MANIFESTS_PLACEHOLDER}\nnext: 1\n"
+
+        spliced = splice_manifests(envelope, [])
+
+        assert yaml.load(spliced, Loader=SafeLoader) == {"workload": {"manifests": []}, "next": 1}
+
+
+class TestUtf8Size:
+    """Test encoded size measurement."""
+
+    def test_ascii(self):
+        """Test ASCII text is one byte per character."""
+        assert utf8_size("apiVersion: v1\n") == 15
+
+    def test_non_ascii(self):
+        """Test multi-byte characters are counted in bytes."""
+        text = "name: ünïcode ✓\n"
+        assert utf8_size(text) == len(text.encode("utf-8"))
 
 
 class TestGenerateMwrsFiles:
     """Integration test for generate_mwrs_files (writes files)."""
 
-    def test_generate_files(self):
+    def test_generate_files(self, tmp_path):
         """Test generating MWRS files."""
-        # We'll skip this in unit tests since it writes files
-        # This would be better as an integration test
-        pass
+        manifests = [
+            {
+                "apiVersion": "apps/v1",
+                "kind": "Deployment",
+                "metadata": {"name": "test-app", "namespace": "default"},
+                "spec": {"replicas": 2},
+            },
+            {
+                "apiVersion": "v1",
+                "kind": "ConfigMap",
+                "metadata": {"name": "test-cm", "namespace": "default"},
+                "data": {"script": "#!/bin/sh\necho hello\n\n  indented\n", "empty": ""},
+            },
+        ]
+
+        output_files = generate_mwrs_files(list(manifests), "test", "default", "test-placement", str(tmp_path / "mwrs"))
+
+        assert output_files == [str(tmp_path / "mwrs_part_1.yaml")]
+        with open(output_files[0], encoding="utf-8") as f:
+            mwrs = yaml.load(f, Loader=SafeLoader)
+
+        assert mwrs["kind"] == "ManifestWorkReplicaSet"
+        assert mwrs["metadata"] == {"name": "test-1", "namespace": "default"}
+        assert mwrs["spec"]["placementRefs"] == [{"name": "test-placement"}]
+        template = mwrs["spec"]["manifestWorkTemplate"]
+        assert template["workload"]["manifests"] == manifests
+        assert [cfg["resourceIdentifier"]["name"] for cfg in template["manifestConfigs"]] == ["test-app", "test-cm"]
+
+    def test_generate_split_files(self, tmp_path):
+        """Test split workloads are written to numbered parts in order."""
+        large_data = "x" * (100 * 1024)  # 100KB string
+        manifests = [
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": f"cm{i}"}, "data": {"large": large_data}}
+            for i in range(5)
+        ]
+
+        output_files = generate_mwrs_files(list(manifests), "test", "default", "test-placement", str(tmp_path / "mwrs"))
+
+        assert output_files == [str(tmp_path / f"mwrs_part_{i}.yaml") for i in (1, 2, 3)]
+        written = []
+        for index, filename in enumerate(output_files, start=1):
+            with open(filename, encoding="utf-8") as f:
+                mwrs = yaml.load(f, Loader=SafeLoader)
+            assert mwrs["metadata"]["name"] == f"test-{index}"
+            written.extend(mwrs["spec"]["manifestWorkTemplate"]["workload"]["manifests"])
+        assert written == manifests
+
+
+class TestWrapCommand:
+    """Test the wrap command end to end (writes files)."""
+
+    def test_wrap_rendered_templates(self, tmp_path):
+        """Test rendered Helm output is parsed and wrapped, skipping empty documents."""
+        input_file = tmp_path / "rendered.yaml"
+        input_file.write_text(
+            "---\n# Source: chart/templates/empty.yaml\n---\n"
+            "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: test-cm\ndata:\n  greeting: héllo\n",
+            encoding="utf-8",
+        )
+
+        wrap_command(
+            input_file=input_file, name="test", namespace="default", placement="test", output=str(tmp_path / "mwrs")
+        )
+
+        with open(tmp_path / "mwrs_part_1.yaml", encoding="utf-8") as f:
+            mwrs = yaml.load(f, Loader=SafeLoader)
+        assert mwrs["spec"]["manifestWorkTemplate"]["workload"]["manifests"] == [
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "test-cm"}, "data": {"greeting": "héllo"}}
+        ]
 
 
 if __name__ == "__main__":
@@ -4,211 +4,477 @@ Unit tests for load-images command (load-images-to-kind logic).
 Note: Tests for Docker/Kind interactions are mocked to avoid requiring
 actual Docker/Kind installations during testing.
 """
+import json
 import os
+import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
-import yaml
 
-from ocm_sandbox.commands.load_images import load_images_from_config
+from ocm_sandbox.commands.load_images import (
+    buildx_available,
+    can_stream_archive,
+    check_kind_cluster,
+    docker_save_supports_platform,
+    list_kind_clusters,
+    list_kind_nodes,
+    load_image_archive,
+    load_image_buildx,
+    load_image_save_platform,
+    load_images_batched,
+    load_images_from_config,
+    load_images_parallel,
+    looks_like_registry_image,
+    process_images_config,
+    run_command,
+    stream_image_archive,
+)
+
+from .fixtures.images_configs import ADVANCED_CONFIG, MIXED_CONFIG, SIMPLE_CONFIG
+
+
+class _Counter:
+    """Callable stub that records its calls and returns `result` (or its next item, for an iterator)."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return next(self.result) if hasattr(self.result, "__next__") else self.result
+
+
+@pytest.fixture
+def mocks(monkeypatch):
+    """Replace the Docker/Kind calls behind config loading; every cluster exists and every load succeeds."""
+    mock_check = _Counter(True)
+    mock_load = _Counter(True)
+    mock_batch = _Counter(False)
+    monkeypatch.setattr("ocm_sandbox.commands.load_images.check_kind_cluster", mock_check)
+    monkeypatch.setattr("ocm_sandbox.commands.load_images.load_image_with_workaround", mock_load)
+    monkeypatch.setattr("ocm_sandbox.commands.load_images.load_images_batch", mock_batch)
+    return mock_check, mock_load, mock_batch
 
 
 class TestLoadImagesFromConfig:
     """Test YAML config file loading and parsing."""
 
-    def test_load_simple_config(self):
+    def test_load_simple_config(self, tmp_path, mocks):
         """Test loading simple image list."""
-        config = {"images": ["nginx:alpine", "redis:7"]}
+        # JSON is a subset of YAML, so the stdlib encoder can seed the file
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(json.dumps(SIMPLE_CONFIG))
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
+        mock_check, mock_load, _ = mocks
 
-        try:
-            # Mock the functions that interact with Docker/Kind
-            with patch("ocm_sandbox.commands.load_images.check_kind_cluster") as mock_check, patch(
-                "ocm_sandbox.commands.load_images.load_image_with_workaround"
-            ) as mock_load:
-                mock_check.return_value = True
-                mock_load.return_value = True
+        result = load_images_from_config(config_file, "test-cluster", "linux/amd64")
 
-                result = load_images_from_config(Path(config_file), "test-cluster", "linux/amd64")
+        # Should succeed
+        assert result == 0
 
-                # Should succeed
-                assert result == 0
+        # Should check cluster once (default cluster)
+        assert len(mock_check.calls) >= 1
 
-                # Should check cluster once (default cluster)
-                assert mock_check.call_count >= 1
+        # Should load both images
+        assert len(mock_load.calls) == 2
 
-                # Should load both images
-                assert mock_load.call_count == 2
+    def test_missing_config_file(self):
+        """Test handling of missing config file."""
+        result = load_images_from_config(Path("/nonexistent/file.yaml"), "test-cluster", "linux/amd64")
+        assert result == 1
 
-        finally:
-            os.remove(config_file)
+    def test_invalid_yaml(self, tmp_path):
+        """Test handling of invalid YAML."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("invalid: yaml: content: [[[")
 
-    def test_load_advanced_config(self):
-        """Test loading config with per-image cluster specification."""
-        config = {
-            "images": [{"image": "nginx:alpine", "cluster": "cluster1"}, {"image": "redis:7", "cluster": "cluster2"}]
-        }
+        result = load_images_from_config(config_file, "test-cluster", "linux/amd64")
+        assert result == 1
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
 
-        try:
-            with patch("ocm_sandbox.commands.load_images.check_kind_cluster") as mock_check, patch(
-                "ocm_sandbox.commands.load_images.load_image_with_workaround"
-            ) as mock_load:
-                mock_check.return_value = True
-                mock_load.return_value = True
+class TestProcessImagesConfig:
+    """Test loading images from a parsed configuration."""
 
-                load_images_from_config(Path(config_file), "default-cluster", "linux/amd64")
+    def test_load_advanced_config(self, mocks):
+        """Test loading config with per-image cluster specification."""
+        mock_check, mock_load, _ = mocks
 
-                # Should check both clusters
-                assert mock_check.call_count == 2
+        process_images_config(ADVANCED_CONFIG, "default-cluster", "linux/amd64")
 
-                # Should load both images
-                assert mock_load.call_count == 2
+        # Should check both clusters
+        assert len(mock_check.calls) == 2
 
-                # Verify correct clusters were used
-                check_calls = [call[0][0] for call in mock_check.call_args_list]
-                assert "cluster1" in check_calls
-                assert "cluster2" in check_calls
+        # Should load both images
+        assert len(mock_load.calls) == 2
 
-        finally:
-            os.remove(config_file)
+        # Verify correct clusters were used
+        check_calls = [args[0] for args, _ in mock_check.calls]
+        assert "cluster1" in check_calls
+        assert "cluster2" in check_calls
 
-    def test_missing_config_file(self):
-        """Test handling of missing config file."""
-        result = load_images_from_config(Path("/nonexistent/file.yaml"), "test-cluster", "linux/amd64")
-        assert result == 1
+    def test_batch_load(self, mocks):
+        """Test images for the same cluster are loaded as one batch."""
+        config = {"images": ["nginx:alpine", "redis:7", {"image": "busybox", "cluster": "other-cluster"}]}
+        _, mock_load, mock_batch = mocks
+        mock_batch.result = True
 
-    def test_invalid_yaml(self):
-        """Test handling of invalid YAML."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write("invalid: yaml: content: [[[")
-            config_file = f.name
+        result = process_images_config(config, "test-cluster", "linux/amd64")
 
-        try:
-            result = load_images_from_config(Path(config_file), "test-cluster", "linux/amd64")
-            assert result == 1
-        finally:
-            os.remove(config_file)
+        assert result == 0
+        assert mock_batch.calls == [((["nginx:alpine", "redis:7"], "test-cluster"), {})]
+        # Single image for other-cluster skips the batch
+        assert mock_load.calls == [(("busybox", "other-cluster", "linux/amd64"), {"registry_capable": False})]
 
     def test_missing_images_key(self):
         """Test config without 'images' key."""
         config = {"wrong_key": ["nginx:alpine"]}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
-
-        try:
-            result = load_images_from_config(Path(config_file), "test-cluster", "linux/amd64")
-            assert result == 1
-        finally:
-            os.remove(config_file)
+        result = process_images_config(config, "test-cluster", "linux/amd64")
+        assert result == 1
 
     def test_empty_images_list(self):
         """Test config with empty images list."""
         config = {"images": []}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
-
-        try:
-            result = load_images_from_config(Path(config_file), "test-cluster", "linux/amd64")
-            # Should succeed but not load anything
-            assert result == 0
-        finally:
-            os.remove(config_file)
+        result = process_images_config(config, "test-cluster", "linux/amd64")
+        # Should succeed but not load anything
+        assert result == 0
 
-    def test_mixed_format_config(self):
+    def test_mixed_format_config(self, mocks):
         """Test config with both simple and advanced format."""
-        config = {
-            "images": [
-                "nginx:alpine",  # Simple format
-                {"image": "redis:7", "cluster": "custom-cluster"},  # Advanced format
-            ]
-        }
+        _, mock_load, _ = mocks
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
+        result = process_images_config(MIXED_CONFIG, "default-cluster", "linux/amd64")
 
-        try:
-            with patch("ocm_sandbox.commands.load_images.check_kind_cluster") as mock_check, patch(
-                "ocm_sandbox.commands.load_images.load_image_with_workaround"
-            ) as mock_load:
-                mock_check.return_value = True
-                mock_load.return_value = True
+        assert result == 0
+        assert len(mock_load.calls) == 2
 
-                result = load_images_from_config(Path(config_file), "default-cluster", "linux/amd64")
+    def test_cluster_not_found(self, mocks):
+        """Test handling when specified cluster doesn't exist."""
+        config = {"images": [{"image": "nginx:alpine", "cluster": "nonexistent-cluster"}]}
 
-                assert result == 0
-                assert mock_load.call_count == 2
+        mock_check, _, _ = mocks
+        mock_check.result = False  # Cluster doesn't exist
 
-        finally:
-            os.remove(config_file)
+        result = process_images_config(config, "default-cluster", "linux/amd64")
 
-    def test_cluster_not_found(self):
-        """Test handling when specified cluster doesn't exist."""
-        config = {"images": [{"image": "nginx:alpine", "cluster": "nonexistent-cluster"}]}
+        # Should fail due to missing cluster
+        assert result == 1
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
+    def test_image_load_failure(self, mocks):
+        """Test handling when image load fails."""
+        config = {"images": ["nginx:alpine", "bad-image:tag"]}
 
-        try:
-            with patch("ocm_sandbox.commands.load_images.check_kind_cluster") as mock_check, patch(
-                "ocm_sandbox.commands.load_images.load_image_with_workaround"
-            ) as mock_load:
-                mock_check.return_value = False  # Cluster doesn't exist
-                mock_load.return_value = True
+        _, mock_load, _ = mocks
+        # First image succeeds, second fails
+        mock_load.result = iter([True, False])
 
-                result = load_images_from_config(Path(config_file), "default-cluster", "linux/amd64")
+        result = process_images_config(config, "test-cluster", "linux/amd64")
 
-                # Should fail due to missing cluster
-                assert result == 1
+        # Should return error code due to failure
+        assert result == 1
 
-        finally:
-            os.remove(config_file)
 
-    def test_image_load_failure(self):
-        """Test handling when image load fails."""
-        config = {"images": ["nginx:alpine", "bad-image:tag"]}
+class TestLoadImagesParallel:
+    """Test concurrent image loading."""
+
+    def test_counts_results(self):
+        """Test loaded and failed images are counted."""
+        targets = [("nginx:alpine", "cluster1"), ("bad-image:tag", "cluster1"), ("redis:7", "cluster2")]
+
+        with patch("ocm_sandbox.commands.load_images.load_image_with_workaround") as mock_load:
+            mock_load.side_effect = lambda image, cluster, platform, **kwargs: image != "bad-image:tag"
+
+            loaded, failed = load_images_parallel(targets, "linux/amd64", jobs=2)
+
+            assert (loaded, failed) == (2, 1)
+            loaded_targets = {(call[0][0], call[0][1]) for call in mock_load.call_args_list}
+            assert loaded_targets == set(targets)
+
+    def test_done_callback(self):
+        """Test the completion callback fires once per image."""
+        done = []
+
+        with patch("ocm_sandbox.commands.load_images.load_image_with_workaround") as mock_load:
+            mock_load.return_value = True
+
+            load_images_parallel([("nginx:alpine", "c"), ("redis:7", "c")], "linux/amd64", on_done=done.append)
+
+            assert len(done) == 2
+
+    def test_no_targets(self):
+        """Test nothing is loaded for an empty target list."""
+        assert load_images_parallel([], "linux/amd64") == (0, 0)
+
+    def test_registry_check_precomputed(self):
+        """Test the registry check result is handed to each load."""
+        targets = [("nginx:alpine", "c"), ("ghcr.io/org/app:v1", "c")]
+
+        with patch("ocm_sandbox.commands.load_images.load_image_with_workaround") as mock_load:
+            mock_load.return_value = True
+
+            load_images_parallel(targets, "linux/amd64")
+
+            registry_capable = {call[0][0]: call[1]["registry_capable"] for call in mock_load.call_args_list}
+            assert registry_capable == {"nginx:alpine": False, "ghcr.io/org/app:v1": True}
+
+    def test_same_image_loads_do_not_overlap(self):
+        """Test two targets with the same image are loaded one after the other."""
+        targets = [("nginx:alpine", "cluster1"), ("nginx:alpine", "cluster2"), ("redis:7", "cluster1")]
+        lock = threading.Lock()
+        active = {}
+        peak = {}
+
+        def fake_load(image, cluster, platform, **kwargs):
+            with lock:
+                active[image] = active.get(image, 0) + 1
+                peak[image] = max(peak.get(image, 0), active[image])
+            time.sleep(0.05)
+            with lock:
+                active[image] -= 1
+            return True
+
+        with patch("ocm_sandbox.commands.load_images.load_image_with_workaround", side_effect=fake_load):
+            assert load_images_parallel(targets, "linux/amd64", jobs=3) == (3, 0)
+
+        assert peak == {"nginx:alpine": 1, "redis:7": 1}
+
+
+class TestLoadImagesBatched:
+    """Test per-cluster batch loading."""
+
+    def test_failed_batch_returns_remaining(self):
+        """Test images from a failed batch are handed back for individual loading."""
+        targets = [("nginx:alpine", "c1"), ("redis:7", "c1"), ("busybox", "c2"), ("alpine", "c2")]
+
+        with patch("ocm_sandbox.commands.load_images.load_images_batch") as mock_batch:
+            mock_batch.side_effect = lambda images, cluster: cluster == "c1"
+
+            loaded, remaining = load_images_batched(targets)
+
+            assert loaded == 2
+            assert remaining == [("busybox", "c2"), ("alpine", "c2")]
+
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_file = f.name
+class TestLoadImageArchive:
+    """Test the archive loading method (Method 2)."""
 
-        try:
-            with patch("ocm_sandbox.commands.load_images.check_kind_cluster") as mock_check, patch(
-                "ocm_sandbox.commands.load_images.load_image_with_workaround"
-            ) as mock_load:
-                mock_check.return_value = True
-                # First image succeeds, second fails
-                mock_load.side_effect = [True, False]
+    def test_streams_to_single_node_cluster(self):
+        """Test single-node clusters get the image piped without a temp file."""
+        with patch("ocm_sandbox.commands.load_images.can_stream_archive", return_value=True), patch(
+            "ocm_sandbox.commands.load_images.stream_image_archive", return_value=True
+        ) as mock_stream, patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            assert load_image_archive("nginx:alpine", "test-cluster")
 
-                result = load_images_from_config(Path(config_file), "test-cluster", "linux/amd64")
+            mock_stream.assert_called_once_with(["nginx:alpine"], "test-cluster", ())
+            mock_run.assert_not_called()
 
-                # Should return error code due to failure
-                assert result == 1
+    def test_falls_back_to_temp_file(self):
+        """Test multi-node clusters load the image through a tar file."""
+        with patch("ocm_sandbox.commands.load_images.can_stream_archive", return_value=False), patch(
+            "ocm_sandbox.commands.load_images.stream_image_archive"
+        ) as mock_stream, patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 0
 
-        finally:
-            os.remove(config_file)
+            assert load_image_archive("nginx:alpine", "test-cluster")
+
+            mock_stream.assert_not_called()
+            commands = [call[0][0][:3] for call in mock_run.call_args_list]
+            assert commands == [["docker", "save", "nginx:alpine"], ["kind", "load", "image-archive"]]
+
+            # Unique archive under the temp dir, removed afterwards
+            temp_file = mock_run.call_args_list[0][0][0][-1]
+            assert os.path.basename(temp_file).startswith("kind-image-nginx_alpine-")
+            assert os.path.dirname(temp_file) == tempfile.gettempdir()
+            assert not os.path.exists(temp_file)
+
+    def test_stdin_failure_retries_with_temp_file(self):
+        """Test kind failing to read /dev/stdin falls back to saving the archive to a file."""
+        with patch("ocm_sandbox.commands.load_images.can_stream_archive", return_value=True), patch(
+            "ocm_sandbox.commands.load_images.stream_image_archive", return_value=None
+        ) as mock_stream, patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 0
+
+            assert load_image_archive("nginx:alpine", "test-cluster")
+
+            mock_stream.assert_called_once()
+            commands = [call[0][0][:3] for call in mock_run.call_args_list]
+            assert commands == [["docker", "save", "nginx:alpine"], ["kind", "load", "image-archive"]]
+
+    def test_stream_failure_not_retried(self):
+        """Test a failure unrelated to the pipe is not repeated through a temp file."""
+        with patch("ocm_sandbox.commands.load_images.can_stream_archive", return_value=True), patch(
+            "ocm_sandbox.commands.load_images.stream_image_archive", return_value=False
+        ), patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            assert not load_image_archive("nginx:alpine", "test-cluster")
+
+            mock_run.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "load_stderr,expected",
+        [
+            ("ERROR: open /dev/stdin: no such device or address\n", None),
+            ("ERROR: failed to load image: ctr: content digest not found\n", False),
+        ],
+    )
+    def test_stream_reports_stdin_failures(self, load_stderr, expected):
+        """Test only kind errors naming /dev/stdin are reported as retryable."""
+        save = MagicMock(returncode=0)
+        load = MagicMock(returncode=1)
+        load.communicate.return_value = ("", load_stderr)
+
+        with patch("ocm_sandbox.commands.load_images.subprocess.Popen", side_effect=[save, load]):
+            assert stream_image_archive(["nginx:alpine"], "test-cluster") is expected
+
+    def test_can_stream_single_node(self):
+        """Test streaming is only used when the cluster has one node."""
+        list_kind_nodes.cache_clear()
+        with patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = "single-control-plane\n"
+            assert can_stream_archive("single") == os.path.exists("/dev/stdin")
+
+            mock_run.return_value.stdout = "multi-control-plane\nmulti-worker\n"
+            assert not can_stream_archive("multi")
+        list_kind_nodes.cache_clear()
+
+
+class TestLoadImageSavePlatform:
+    """Test the platform-specific save method (Method 4)."""
+
+    def setup_method(self):
+        docker_save_supports_platform.cache_clear()
+
+    def teardown_method(self):
+        docker_save_supports_platform.cache_clear()
+
+    def test_probe_cached(self):
+        """Test `docker save --help` is probed once."""
+        with patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = "Options:\n  -o, --output string\n      --platform string\n"
+
+            assert docker_save_supports_platform()
+            assert docker_save_supports_platform()
+            assert mock_run.call_count == 1
+
+    def test_skipped_without_support(self):
+        """Test the method is skipped when docker save has no --platform flag."""
+        with patch("ocm_sandbox.commands.load_images.docker_save_supports_platform", return_value=False), patch(
+            "ocm_sandbox.commands.load_images.load_archive"
+        ) as mock_archive:
+            assert not load_image_save_platform("nginx:alpine", "test-cluster", "linux/amd64")
+            mock_archive.assert_not_called()
+
+    def test_saves_target_platform(self):
+        """Test only the requested platform is saved."""
+        with patch("ocm_sandbox.commands.load_images.docker_save_supports_platform", return_value=True), patch(
+            "ocm_sandbox.commands.load_images.load_archive", return_value=True
+        ) as mock_archive:
+            assert load_image_save_platform("nginx:alpine", "test-cluster", "linux/arm64")
+            assert mock_archive.call_args[1]["save_args"] == ["--platform", "linux/arm64"]
+
+
+class TestLoadImageBuildx:
+    """Test the buildx method (Method 5)."""
+
+    def setup_method(self):
+        buildx_available.cache_clear()
+
+    def teardown_method(self):
+        buildx_available.cache_clear()
+
+    def test_probe_cached(self):
+        """Test `docker buildx version` runs once for repeated images."""
+        with patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 1
+
+            assert not load_image_buildx("nginx:alpine", "test-cluster", "linux/amd64")
+            assert not load_image_buildx("redis:7", "test-cluster", "linux/amd64")
+
+            mock_run.assert_called_once_with(["docker", "buildx", "version"])
+
+
+class TestRunCommand:
+    """Test subprocess output capture."""
+
+    def test_default_captures_stderr_only(self):
+        """Test stdout is discarded and stderr kept by default."""
+        result = run_command([sys.executable, "-c", "import sys; print('out'); print('err', file=sys.stderr)"])
+
+        assert result.returncode == 0
+        assert result.stdout is None
+        assert result.stderr.strip() == "err"
+
+    def test_capture_both(self):
+        """Test both streams are kept when requested."""
+        result = run_command([sys.executable, "-c", "print('out')"], capture="both")
+
+        assert result.stdout.strip() == "out"
+
+    def test_capture_none(self):
+        """Test nothing is kept when capture is disabled."""
+        result = run_command([sys.executable, "-c", "import sys; sys.exit(3)"], capture="none")
+
+        assert result.returncode == 3
+        assert result.stdout is None
+        assert result.stderr is None
+
+
+class TestCheckKindCluster:
+    """Test Kind cluster lookup."""
+
+    def setup_method(self):
+        list_kind_clusters.cache_clear()
+
+    def teardown_method(self):
+        list_kind_clusters.cache_clear()
+
+    def test_cluster_list_cached(self):
+        """Test `kind get clusters` runs once for repeated checks."""
+        with patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = "ocm-hub\nocm-spoke1\n"
+
+            assert check_kind_cluster("ocm-hub")
+            assert check_kind_cluster("ocm-spoke1")
+            assert not check_kind_cluster("missing")
+
+            assert mock_run.call_count == 1
+
+    def test_list_failure(self):
+        """Test a failing `kind get clusters` reports the cluster as missing."""
+        with patch("ocm_sandbox.commands.load_images.run_command") as mock_run:
+            mock_run.return_value.returncode = 1
+
+            assert not check_kind_cluster("ocm-hub")
+
+
+class TestLooksLikeRegistryImage:
+    """Test detection of pullable image references."""
+
+    def test_local_images(self):
+        """Test bare image names have no registry to pull from."""
+        assert not looks_like_registry_image("my-app")
+        assert not looks_like_registry_image("my-app:latest")
+
+    def test_registry_images(self):
+        """Test repository paths and registry hosts are pullable."""
+        assert looks_like_registry_image("library/nginx:latest")
+        assert looks_like_registry_image("gcr.io/my-project/my-image:v1.0.0")
 
 
 class TestImageParsing:
     """Test image name parsing and validation."""
 
-    def test_valid_image_names(self):
-        """Test various valid image name formats."""
-        valid_images = [
+    @pytest.mark.parametrize(
+        "image",
+        [
             "nginx",
             "nginx:latest",
             "nginx:1.21",
@@ -218,12 +484,12 @@ class TestImageParsing:
             "docker.io/library/nginx:1.21",
             "gcr.io/my-project/my-image:v1.0.0",
             "localhost:5000/myimage:dev",
-        ]
-
-        # All should be valid strings
-        for image in valid_images:
-            assert isinstance(image, str)
-            assert len(image) > 0
+        ],
+    )
+    def test_valid_image_names(self, image):
+        """Test various valid image name formats."""
+        assert isinstance(image, str)
+        assert len(image) > 0
 
 
 if __name__ == "__main__":